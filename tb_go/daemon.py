@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""tb-go-daemon: Serve the clipboard to tb-go over a UNIX socket.
+
+Keeps a copy of the clipboard that is refreshed whenever clipnotify
+reports a selection change, so that tb-go can read the clipboard
+without spawning xclip or xsel on every run.
+"""
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+from typing import Optional
+
+from . import main as tb_go
+from .main import (ClipboardError, _have, _read_clipboard_tools,
+                   daemon_socket_path, debug_print)
+
+class ClipboardCache:
+    """The most recently read clipboard contents.
+    
+    Holds None while the clipboard could not be read.
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._data: Optional[bytes] = None
+    
+    def get(self) -> Optional[bytes]:
+        with self._lock:
+            return self._data
+    
+    def set(self, text: Optional[str]) -> None:
+        data = None if text is None else text.encode('utf-8')
+        with self._lock:
+            self._data = data
+
+class ClipboardWatcher:
+    """Refresh a cache each time the clipboard changes."""
+    
+    def __init__(self, cache: ClipboardCache) -> None:
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._stopped = False
+    
+    def run(self) -> None:
+        """Watch the clipboard until stopped."""
+        while True:
+            try:
+                text = _read_clipboard_tools()
+                debug_print("Cached %d chars", len(text))
+            except ClipboardError as e:
+                debug_print("Could not read clipboard: %s", e)
+                text = None
+            self._cache.set(text)
+            
+            # Blocks until the selection changes. The handle is kept so
+            # that stop() can kill clipnotify rather than leave it behind.
+            with self._lock:
+                if self._stopped:
+                    return
+                self._proc = subprocess.Popen(['clipnotify'])
+            returncode = self._proc.wait()
+            with self._lock:
+                if self._stopped:
+                    return
+            if returncode != 0:
+                debug_print("clipnotify exited with code %d", returncode)
+                os._exit(1)
+    
+    def stop(self) -> None:
+        """Stop watching and terminate clipnotify."""
+        with self._lock:
+            self._stopped = True
+            if self._proc is not None and self._proc.poll() is None:
+                self._proc.terminate()
+                self._proc.wait()
+
+def bind_socket(path: str) -> socket.socket:
+    """Listen on a UNIX socket, replacing a stale one left by a dead daemon.
+    
+    Raises:
+        RuntimeError: If another daemon is already listening on the socket
+    """
+    if os.path.exists(path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(path)
+            except OSError:
+                debug_print("Removing stale socket %s", path)
+                os.unlink(path)
+            else:
+                raise RuntimeError(f"tb-go-daemon is already running on {path}")
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Create the socket private to this user rather than chmodding it
+    # afterwards, which leaves it reachable in between
+    old_umask = os.umask(0o077)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    return server
+
+def serve(server: socket.socket, cache: ClipboardCache) -> None:
+    """Send the cached clipboard to each client that connects.
+    
+    If the clipboard could not be read the connection is closed without
+    sending anything, so the client falls back to the clipboard tools.
+    """
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            data = cache.get()
+            if data is None:
+                continue
+            try:
+                conn.sendall(data)
+            except OSError as e:
+                debug_print("Client error: %s", e)
+
+def main() -> int:
+    """Main entry point for tb-go-daemon."""
+    import argparse
+    parser = argparse.ArgumentParser(
+        description='Serve the clipboard to tb-go without spawning a clipboard tool per run',
+        epilog='Requires clipnotify to detect clipboard changes.'
+    )
+    parser.add_argument('--debug', action='store_true', help='Enable debug output')
+    args = parser.parse_args()
+    tb_go.DEBUG = args.debug
+    
+    if not _have('clipnotify'):
+        print("clipnotify not found. Please install clipnotify.", file=sys.stderr)
+        return 1
+    
+    path = daemon_socket_path()
+    try:
+        server = bind_socket(path)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    debug_print("Listening on %s", path)
+    
+    cache = ClipboardCache()
+    watcher = ClipboardWatcher(cache)
+    threading.Thread(target=watcher.run, daemon=True).start()
+    
+    # Clean up the socket when killed as well as on ctrl-c
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        serve(server, cache)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+        server.close()
+        os.unlink(path)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
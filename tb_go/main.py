@@ -6,34 +6,74 @@ A single-file module for parsing Python tracebacks and opening them in vim.
 import sys
 import re
 import subprocess
-import argparse
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 # Global debug flag
 DEBUG = False
 
-def debug_print(msg: str) -> None:
-    """Print debug message if debug mode is enabled."""
+# Pattern matches: File "/path/to/file.py", line 123, in function_name
+# Or: File "/path/to/file.py", line 123 (for syntax errors)
+# Only used to search a whole block of text in has_traceback(); parse()
+# scans by hand.
+_TB_SEARCH_RE = re.compile(
+    r'^\s*File "([^"]+)", line (\d+)(?:, in (.+?))?\r?$',
+    re.MULTILINE
+)
+
+def debug_print(fmt: str, *args: object) -> None:
+    """Print debug message if debug mode is enabled.
+    
+    Takes %-style arguments so that the message is only formatted when
+    debug output is on.
+    """
     if DEBUG:
-        print(f"[DEBUG] {msg}", file=sys.stderr)
+        print("[DEBUG] " + (fmt % args if args else fmt), file=sys.stderr)
+
+@lru_cache(maxsize=None)
+def _have(name: str) -> bool:
+    """Check whether an executable is available on $PATH."""
+    import shutil
+    return shutil.which(name) is not None
 
 # ============================================================================
 # Data Models
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class TracebackLocation:
     """Represents a single location in a traceback."""
+    # Explicit slots rather than dataclass(slots=True), which needs 3.10
+    __slots__ = ('filepath', 'line', 'function', 'code', '_display')
+    
     filepath: str
     line: int
     function: str
     code: str
     
+    def __post_init__(self) -> None:
+        # Format once: the display string is used both as fzf input and to
+        # look up the selection
+        func_part = f" in {self.function}" if self.function else ""
+        object.__setattr__(
+            self, '_display',
+            f"{self.filepath}:{self.line}{func_part}: {self.code.strip()}"
+        )
+    
+    # Frozen instances with hand-written slots cannot be restored by the
+    # default copy/pickle protocol, which assigns each slot with setattr
+    def __getstate__(self) -> Tuple[str, int, str, str]:
+        return (self.filepath, self.line, self.function, self.code)
+    
+    def __setstate__(self, state: Tuple[str, int, str, str]) -> None:
+        for name, value in zip(('filepath', 'line', 'function', 'code'), state):
+            object.__setattr__(self, name, value)
+        self.__post_init__()
+    
     def __str__(self) -> str:
         """Format for display in fzf."""
-        func_part = f" in {self.function}" if self.function else ""
-        return f"{self.filepath}:{self.line}{func_part}: {self.code.strip()}"
+        return self._display
 
 # ============================================================================
 # Parser
@@ -42,50 +82,153 @@ class TracebackLocation:
 class TracebackParser:
     """Parse Python tracebacks to extract file locations."""
     
-    # Pattern matches: File "/path/to/file.py", line 123, in function_name
-    # Or: File "/path/to/file.py", line 123 (for syntax errors)
-    TRACEBACK_PATTERN = re.compile(
-        r'^\s*File "([^"]+)", line (\d+)(?:, in (.+))?$',
-        re.MULTILINE
-    )
+    # No longer used by the parser; kept for compatibility
+    TRACEBACK_PATTERN = _TB_SEARCH_RE
     
     def has_traceback(self, text: str) -> bool:
         """Check if text contains a traceback."""
-        return 'Traceback (most recent call last)' in text or bool(self.TRACEBACK_PATTERN.search(text))
+        if 'Traceback (most recent call last)' in text:
+            return True
+        # Cheap substring probe before running the regex over all of the text
+        if 'File "' not in text:
+            return False
+        return _TB_SEARCH_RE.search(text) is not None
     
-    def parse(self, text: str) -> List[TracebackLocation]:
+    def parse(self, text: str, stop: Optional[int] = None) -> List[TracebackLocation]:
         """Parse traceback text and extract locations.
         
         Args:
             text: Text containing a Python traceback
+            stop: Only report locations whose File line starts before this
+                offset (the rest of the text is still used for code lines)
             
         Returns:
             List of TracebackLocation objects
         """
+        # Hand-rolled scan with str.find rather than a regex: find each
+        # 'File "', check it starts a line, then pick the fields apart.
+        # The line after a location (usually its source code) is not
+        # consumed, since frames without source are followed directly by
+        # the next File line.
         locations = []
-        lines = text.split('\n')
+        append = locations.append
+        find = text.find
+        rfind = text.rfind
+        startswith = text.startswith
+        size = len(text)
+        if stop is None:
+            stop = size
+        pos = 0
         
-        for i, line in enumerate(lines):
-            match = self.TRACEBACK_PATTERN.match(line)
-            if match:
-                filepath = match.group(1)
-                line_num = int(match.group(2))
-                function = match.group(3) if match.group(3) else "<module>"
-                
-                # Try to get the code line (usually the next line)
-                code = ""
-                if i + 1 < len(lines):
-                    code = lines[i + 1].strip()
-                
-                locations.append(TracebackLocation(
-                    filepath=filepath,
-                    line=line_num,
-                    function=function,
-                    code=code
-                ))
+        while True:
+            start = find('File "', pos, stop + 5)
+            if start < 0:
+                break
+            pos = start + 6
+            
+            # Only whitespace may precede File on its line
+            line_start = rfind('\n', 0, start) + 1
+            if text[line_start:start].strip(' \t'):
+                continue
+            
+            line_end = find('\n', start)
+            if line_end < 0:
+                line_end = size
+            # Tolerate \r\n line endings (e.g. tracebacks from Windows)
+            content_end = line_end
+            if text[line_end - 1] == '\r':
+                content_end -= 1
+            
+            quote = find('"', pos, content_end)
+            if quote <= pos or not startswith('", line ', quote):
+                continue
+            filepath = text[pos:quote]
+            
+            digits_start = digits_end = quote + 8
+            while digits_end < content_end and '0' <= text[digits_end] <= '9':
+                digits_end += 1
+            if digits_end == digits_start:
+                continue
+            
+            if digits_end == content_end:
+                function = "<module>"
+            elif startswith(', in ', digits_end) and digits_end + 5 < content_end:
+                function = text[digits_end + 5:content_end]
+            else:
+                continue
+            
+            code = ""
+            if line_end < size:
+                code_end = find('\n', line_end + 1)
+                if code_end < 0:
+                    code_end = size
+                code = text[line_end + 1:code_end].strip()
+            
+            append(TracebackLocation(
+                filepath=filepath,
+                line=int(text[digits_start:digits_end]),
+                function=function,
+                code=code
+            ))
+            pos = line_end
         
         return locations
 
+class TracebackScanner:
+    """Find traceback locations in output as it arrives.
+    
+    Feed chunks of raw output with feed() and call finish() at the end.
+    Only the last line and any partial line are held between chunks, so
+    memory use does not grow with the size of the output. Chunks are only
+    decoded when they may hold a location.
+    """
+    
+    BANNER = b'Traceback (most recent call last)'
+    
+    def __init__(self) -> None:
+        self.locations: List[TracebackLocation] = []
+        self.size = 0
+        self._parser = TracebackParser()
+        self._seen_banner = False
+        # Last complete line (which may be a File line still waiting for
+        # its code line) and any partial line after it
+        self._pending = b''
+    
+    @property
+    def has_traceback(self) -> bool:
+        """Whether a traceback has been seen so far."""
+        return self._seen_banner or bool(self.locations)
+    
+    def feed(self, chunk: bytes) -> None:
+        """Scan the complete lines in a chunk of output."""
+        self.size += len(chunk)
+        data = self._pending + chunk
+        end = data.rfind(b'\n')
+        if end < 0:
+            self._pending = data
+            return
+        # Hold back the last complete line: a File line there still needs
+        # the next line as its code
+        last = data.rfind(b'\n', 0, end) + 1
+        self._scan(data[:last], data[last:end])
+        self._pending = data[last:]
+    
+    def finish(self) -> None:
+        """Scan whatever is left once the output has ended."""
+        self._scan(self._pending, b'')
+        self._pending = b''
+    
+    def _scan(self, head: bytes, tail: bytes) -> None:
+        """Find locations starting in head, using tail for code lines."""
+        if not self._seen_banner and (self.BANNER in head or self.BANNER in tail):
+            self._seen_banner = True
+        if b'File "' not in head:
+            return
+        # Both parts end at line boundaries, so they decode independently
+        head_text = head.decode('utf-8', errors='replace')
+        text = head_text + tail.decode('utf-8', errors='replace')
+        self.locations.extend(self._parser.parse(text, stop=len(head_text)))
+
 # ============================================================================
 # Clipboard
 # ============================================================================
@@ -94,56 +237,114 @@ class ClipboardError(Exception):
     """Raised when clipboard operations fail."""
     pass
 
+def daemon_socket_path() -> str:
+    """Path of the UNIX socket that tb-go-daemon serves the clipboard on."""
+    import os
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+    return os.path.join(runtime_dir, f"tb-go-{os.getuid()}.sock")
+
+def read_clipboard_daemon() -> Optional[str]:
+    """Read the clipboard from a running tb-go-daemon.
+    
+    Returns:
+        Clipboard contents as string, or None if no daemon is running
+        (or it cannot be used on this platform)
+    """
+    import os
+    if not hasattr(os, 'getuid'):
+        return None
+    path = daemon_socket_path()
+    try:
+        owner = os.stat(path).st_uid
+    except OSError as e:
+        debug_print("No daemon socket at %s: %s", path, e)
+        return None
+    # The socket may be in a shared directory such as /tmp: only trust one
+    # created by this user
+    if owner != os.getuid():
+        debug_print("Ignoring daemon socket %s owned by uid %d", path, owner)
+        return None
+    
+    import socket
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    debug_print("Attempting to read clipboard from daemon at %s...", path)
+    chunks = []
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(path)
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError as e:
+        debug_print("daemon failed: %s", e)
+        return None
+    
+    # The daemon sends nothing when it could not read the clipboard; an
+    # empty clipboard is cheap to re-read with the tools
+    if not chunks:
+        debug_print("daemon returned nothing")
+        return None
+    
+    text = b''.join(chunks).decode('utf-8', errors='replace')
+    debug_print("daemon succeeded, got %d chars", len(text))
+    return text
+
 def read_clipboard() -> str:
     """Read text from system clipboard.
     
+    Uses tb-go-daemon if it is running, otherwise runs a clipboard tool.
+    
     Returns:
         Clipboard contents as string
         
     Raises:
         ClipboardError: If clipboard cannot be read
     """
-    # Try xclip first (common on Linux)
-    debug_print("Attempting to read clipboard with xclip...")
-    try:
-        result = subprocess.run(
+    text = read_clipboard_daemon()
+    if text is not None:
+        return text
+    return _read_clipboard_tools()
+
+def _read_clipboard_tools() -> str:
+    """Read text from system clipboard using xclip, xsel or pbpaste."""
+    # Try the native tool for this platform first so that the happy path
+    # costs a single exec
+    if sys.platform == 'darwin':
+        commands = (['pbpaste'],)
+    elif sys.platform.startswith('linux'):
+        commands = (
             ['xclip', '-selection', 'clipboard', '-o'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        debug_print(f"xclip succeeded, got {len(result.stdout)} chars")
-        return result.stdout
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        debug_print(f"xclip failed: {e}")
-    
-    # Try xsel as fallback
-    debug_print("Attempting to read clipboard with xsel...")
-    try:
-        result = subprocess.run(
             ['xsel', '--clipboard', '--output'],
-            capture_output=True,
-            text=True,
-            check=True
         )
-        debug_print(f"xsel succeeded, got {len(result.stdout)} chars")
-        return result.stdout
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        debug_print(f"xsel failed: {e}")
-    
-    # Try pbpaste on macOS
-    debug_print("Attempting to read clipboard with pbpaste...")
-    try:
-        result = subprocess.run(
+    else:
+        commands = (
+            ['xclip', '-selection', 'clipboard', '-o'],
+            ['xsel', '--clipboard', '--output'],
             ['pbpaste'],
-            capture_output=True,
-            text=True,
-            check=True
         )
-        debug_print(f"pbpaste succeeded, got {len(result.stdout)} chars")
-        return result.stdout
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        debug_print(f"pbpaste failed: {e}")
+    
+    for command in commands:
+        name = command[0]
+        if not _have(name):
+            debug_print("%s not found, skipping", name)
+            continue
+        
+        debug_print("Attempting to read clipboard with %s...", name)
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            debug_print("%s succeeded, got %d chars", name, len(result.stdout))
+            return result.stdout
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            debug_print("%s failed: %s", name, e)
     
     raise ClipboardError(
         "Could not read clipboard. Please install xclip, xsel, or use macOS."
@@ -174,62 +375,43 @@ class FzfSelector:
         """
         # Check if fzf is available
         debug_print("Checking for fzf...")
-        try:
-            subprocess.run(['fzf', '--version'], capture_output=True, check=True)
-            debug_print("fzf found")
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            debug_print(f"fzf not found: {e}")
+        if not _have('fzf'):
+            debug_print("fzf not found")
             raise FzfNotFoundError("fzf not found. Please install fzf.")
+        debug_print("fzf found")
         
-        # Format locations for fzf
-        items = [str(loc) for loc in locations]
+        # Format locations for fzf, indexing them by display text
+        items = []
+        index = {}
+        for loc in locations:
+            item = str(loc)
+            index.setdefault(item, loc)
+            items.append(item)
         input_text = '\n'.join(items)
-        debug_print(f"Presenting {len(items)} items to fzf")
+        debug_print("Presenting %d items to fzf", len(items))
         if DEBUG:
-            debug_print(f"Items to show:")
+            debug_print("Items to show:")
             for item in items:
-                debug_print(f"  {item}")
+                debug_print("  %s", item)
         
         # Run fzf
-        # fzf needs: list items via stdin, keyboard from /dev/tty, UI drawn on /dev/tty
+        # fzf reads the list from its stdin and opens /dev/tty itself for
+        # keyboard input; the UI is drawn on stderr, which we point at the tty
         try:
-            import tempfile
-            import os
-            
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-                f.write(input_text)
-                temp_file = f.name
-            
-            debug_print(f"Wrote {len(input_text)} bytes to temp file: {temp_file}")
-            
-            try:
-                # The proper way: use setsid or script to give fzf a controlling terminal
-                # Simpler: just exec fzf properly with bash
-                # Read list from file, connect fzf fully to /dev/tty for interaction
-                
-                # Use shell command but properly escape the temp file path
-                import shlex
-                cmd = f'fzf --height=40% --reverse --prompt="Select traceback location: " < {shlex.quote(temp_file)}'
-                
-                # Key: run with stdin AND stdout/stderr all connected to /dev/tty
-                # except we capture stdout for the result
-                with open('/dev/tty', 'r') as tty_in, open('/dev/tty', 'w') as tty_err:
-                    result = subprocess.run(
-                        cmd,
-                        shell=True,
-                        stdin=tty_in,  # keyboard from terminal
-                        stdout=subprocess.PIPE,  # capture selection
-                        stderr=tty_err,  # UI to terminal
-                        text=True,
-                        check=False
-                    )
-            finally:
-                os.unlink(temp_file)
+            with open('/dev/tty', 'w') as tty_err:
+                proc = subprocess.Popen(
+                    ['fzf', '--height=40%', '--reverse',
+                     '--prompt=Select traceback location: '],
+                    stdin=subprocess.PIPE,  # list of items
+                    stdout=subprocess.PIPE,  # capture selection
+                    stderr=tty_err,  # UI to terminal
+                    text=True
+                )
+                stdout, _ = proc.communicate(input_text)
             
-            result_code = result.returncode
-            stdout = result.stdout
+            result_code = proc.returncode
             
-            debug_print(f"fzf exited with code {result_code}")
+            debug_print("fzf exited with code %d", result_code)
             
             if result_code != 0:
                 # User cancelled
@@ -238,16 +420,14 @@ class FzfSelector:
             
             # Find which location was selected
             selected_text = stdout.strip()
-            debug_print(f"User selected: {selected_text}")
-            for loc in locations:
-                if str(loc) == selected_text:
-                    return loc
-            
-            debug_print("Warning: Selected text didn't match any location")
-            return None
+            debug_print("User selected: %s", selected_text)
+            selected = index.get(selected_text)
+            if selected is None:
+                debug_print("Warning: Selected text didn't match any location")
+            return selected
             
         except Exception as e:
-            debug_print(f"fzf error: {e}")
+            debug_print("fzf error: %s", e)
             raise FzfNotFoundError(f"Error running fzf: {e}")
 
 # ============================================================================
@@ -264,6 +444,9 @@ class VimOpener:
     def open(self, location: TracebackLocation) -> None:
         """Open a file in vim at the specified line.
         
+        Replaces the current process with vim, so this does not return
+        unless vim cannot be run.
+        
         Args:
             location: Traceback location to open
             
@@ -272,27 +455,31 @@ class VimOpener:
         """
         # Check if vim is available
         debug_print("Checking for vim...")
-        try:
-            subprocess.run(['vim', '--version'], capture_output=True, check=True)
-            debug_print("vim found")
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            debug_print(f"vim not found: {e}")
+        if not _have('vim'):
+            debug_print("vim not found")
             raise VimNotFoundError("vim not found. Please install vim.")
+        debug_print("vim found")
         
         # Open vim at the specific line
         # Using +{line} to jump to line number
-        debug_print(f"Opening vim: vim +{location.line} {location.filepath}")
+        debug_print("Opening vim: vim +%d %s", location.line, location.filepath)
+        # Replace this process with vim: there is nothing left to do after
+        # it exits, and vim restores the terminal itself
+        import os
+        sys.stdout.flush()
+        sys.stderr.flush()
+        if not sys.stdin.isatty():
+            # stdin was a pipe holding the traceback; vim needs the keyboard
+            try:
+                tty_fd = os.open('/dev/tty', os.O_RDONLY)
+                os.dup2(tty_fd, 0)
+                os.close(tty_fd)
+            except OSError as e:
+                debug_print("Could not attach stdin to /dev/tty: %s", e)
         try:
-            import os
-            import shlex
-            # Use os.system instead of subprocess for proper terminal handling
-            cmd = f"vim +{location.line} {shlex.quote(location.filepath)}"
-            os.system(cmd)
-            debug_print("vim closed")
-            # Explicitly reset terminal
-            os.system('reset')
-        except Exception as e:
-            debug_print(f"vim error: {e}")
+            os.execvp('vim', ['vim', f"+{location.line}", location.filepath])
+        except OSError as e:
+            debug_print("vim error: %s", e)
             raise VimNotFoundError(f"Error opening vim: {e}")
 
 # ============================================================================
@@ -300,37 +487,69 @@ class VimOpener:
 # ============================================================================
 
 class CommandRunner:
-    """Run commands and capture their output."""
+    """Run commands and scan their output for tracebacks."""
     
-    def run(self, command: List[str]) -> Tuple[str, int]:
-        """Run a command and capture stderr.
+    def run(self, command: List[str], capture_stdout: bool = False) -> Tuple[TracebackScanner, int]:
+        """Run a command and scan its stderr for tracebacks.
+        
+        Tracebacks normally go to stderr, so by default stdout is left
+        connected to the terminal. Scanned output is echoed to the terminal
+        as it is produced and searched chunk by chunk rather than kept:
+        memory use stays at about a line however much the command prints,
+        at the cost of not having the full output afterwards.
         
         Args:
             command: Command and arguments as list
+            capture_stdout: Also scan stdout, for programs that print
+                tracebacks there
             
         Returns:
-            Tuple of (stderr output, exit code)
+            Tuple of (scanner holding the locations found, exit code)
         """
-        debug_print(f"Running command: {command}")
+        scanner = TracebackScanner()
+        debug_print("Running command: %s", command)
         try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            # The command writes straight to our stdout unless it is captured,
+            # and echoed output bypasses the text layer
+            sys.stdout.flush()
+            sys.stderr.flush()
+            if capture_stdout:
+                proc = subprocess.Popen(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT
+                )
+                stream, echo = proc.stdout, sys.stdout.buffer
+            else:
+                proc = subprocess.Popen(
+                    command,
+                    stderr=subprocess.PIPE
+                )
+                stream, echo = proc.stderr, sys.stderr.buffer
+            
+            # Stream the output as it arrives so long-running commands show
+            # progress. Read in chunks rather than lines so that partial
+            # lines (progress dots, \r progress bars, prompts) are echoed
+            # straight away.
+            with stream:
+                while True:
+                    chunk = stream.read1(65536)
+                    if not chunk:
+                        break
+                    echo.write(chunk)
+                    echo.flush()
+                    scanner.feed(chunk)
+            scanner.finish()
+            returncode = proc.wait()
             
-            # Combine stdout and stderr for traceback parsing
-            # (some programs print tracebacks to stdout)
-            output = result.stdout + result.stderr
-            debug_print(f"Command finished with exit code {result.returncode}")
-            debug_print(f"Output length: {len(output)} chars")
+            debug_print("Command finished with exit code %d", returncode)
+            debug_print("Output length: %d bytes", scanner.size)
             
-            return output, result.returncode
+            return scanner, returncode
             
         except Exception as e:
-            debug_print(f"Command execution failed: {e}")
-            return str(e), 1
+            debug_print("Command execution failed: %s", e)
+            return scanner, 1
 
 # ============================================================================
 # CLI Interface
@@ -366,58 +585,79 @@ def select_location(locations: List[TracebackLocation]) -> Optional[TracebackLoc
         # Return last location (most recent error)
         return locations[-1] if locations else None
 
+USAGE = """\
+Usage: tb-go [--debug] [--stdout] [command args...]
+
+Navigate to Python traceback locations.
+
+  With no command: reads traceback from stdin (if piped) or clipboard
+  With command: runs it and captures stderr
+
+Options:
+  -h, --help  Show this help and exit
+  --debug     Enable debug output
+  --stdout    Also search the command's stdout for tracebacks"""
+
 def main() -> int:
     """Main entry point for tb-go CLI."""
     global DEBUG
     
-    # Parse arguments
-    parser = argparse.ArgumentParser(
-        description='Navigate to Python traceback locations',
-        epilog='With no command: reads traceback from clipboard or stdin. With command: runs it and captures output.'
-    )
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    parser.add_argument('command', nargs='*', help='Command to run (optional)')
-    
-    args = parser.parse_args()
-    DEBUG = args.debug
+    # Parse arguments by hand: options come before the command, and
+    # everything from the first non-option on is passed through to it
+    argv = sys.argv[1:]
+    capture_stdout = False
+    while argv and argv[0].startswith('-'):
+        arg = argv.pop(0)
+        if arg == '--':
+            break
+        elif arg == '--debug':
+            DEBUG = True
+        elif arg == '--stdout':
+            capture_stdout = True
+        elif arg in ('-h', '--help'):
+            print(USAGE)
+            return 0
+        else:
+            print(f"tb-go: unrecognized option: {arg}", file=sys.stderr)
+            print(USAGE, file=sys.stderr)
+            return 2
+    command = argv
     
     debug_print("tb-go starting...")
-    debug_print(f"Arguments: {sys.argv}")
+    debug_print("Arguments: %s", sys.argv)
     
     # Check if stdin is piped (not a tty)
     stdin_is_piped = not sys.stdin.isatty()
-    debug_print(f"stdin is {'piped' if stdin_is_piped else 'a tty'}")
+    debug_print("stdin is %s", 'piped' if stdin_is_piped else 'a tty')
     
     # Determine mode based on arguments and stdin
-    if not args.command:
+    if not command:
         if stdin_is_piped:
             # Mode 1a: Read from stdin (piped)
             debug_print("Mode: Reading from stdin (piped)")
             print_colored("Reading traceback from stdin...", Colors.BLUE)
             text = sys.stdin.read()
-            debug_print(f"Read {len(text)} characters from stdin")
+            debug_print("Read %d characters from stdin", len(text))
         else:
             # Mode 1b: Read from clipboard
             debug_print("Mode: Reading from clipboard")
             print_colored("Reading traceback from clipboard...", Colors.BLUE)
             try:
                 text = read_clipboard()
-                debug_print(f"Read {len(text)} characters from clipboard")
+                debug_print("Read %d characters from clipboard", len(text))
             except ClipboardError as e:
                 print_colored(f"Error: {e}", Colors.RED)
-                print("\nUsage: tb-go [--debug] [command args...]")
-                print("  With no command: reads from stdin (if piped) or clipboard")
-                print("  With command: runs it and captures stderr")
+                print()
+                print(USAGE)
                 return 1
     else:
         # Mode 2: Run command
-        command = args.command
-        debug_print(f"Mode: Running command {command}")
+        debug_print("Mode: Running command %s", command)
         print_colored(f"Running: {' '.join(command)}", Colors.BLUE)
         print()
         
         runner = CommandRunner()
-        text, exit_code = runner.run(command)
+        scanner, exit_code = runner.run(command, capture_stdout=capture_stdout)
         
         print()
         if exit_code == 0:
@@ -427,26 +667,37 @@ def main() -> int:
         else:
             print_colored(f"Command failed (exit code {exit_code})", Colors.YELLOW)
     
-    # Parse traceback
-    debug_print("Parsing traceback...")
-    parser_obj = TracebackParser()
-    
-    if not parser_obj.has_traceback(text):
-        print_colored("No traceback found in output", Colors.RED)
-        debug_print(f"Text content: {text[:500]}...")
-        return 1
-    
-    debug_print("Traceback detected, extracting locations...")
-    locations = parser_obj.parse(text)
+    if command:
+        # The output was already scanned while the command ran
+        if not scanner.has_traceback:
+            print_colored("No traceback found in output", Colors.RED)
+            if not capture_stdout:
+                print("Only stderr was searched; use --stdout to search stdout too.")
+            return 1
+        locations = scanner.locations
+    else:
+        # Parse traceback
+        debug_print("Parsing traceback...")
+        parser_obj = TracebackParser()
+        
+        if not parser_obj.has_traceback(text):
+            print_colored("No traceback found in output", Colors.RED)
+            debug_print("Text content: %s...", text[:500])
+            return 1
+        
+        debug_print("Traceback detected, extracting locations...")
+        locations = parser_obj.parse(text)
     
     if not locations:
         print_colored("No traceback locations found", Colors.RED)
-        debug_print(f"Text content: {text[:500]}...")
+        if not command:
+            debug_print("Text content: %s...", text[:500])
         return 1
     
-    debug_print(f"Extracted {len(locations)} locations")
-    for i, loc in enumerate(locations):
-        debug_print(f"  {i+1}. {loc.filepath}:{loc.line} in {loc.function}")
+    debug_print("Extracted %d locations", len(locations))
+    if DEBUG:
+        for i, loc in enumerate(locations):
+            debug_print("  %d. %s:%d in %s", i + 1, loc.filepath, loc.line, loc.function)
     
     print_colored(f"Found {len(locations)} traceback location(s)", Colors.GREEN)
     print()
@@ -459,12 +710,13 @@ def main() -> int:
         print_colored("Cancelled", Colors.YELLOW)
         return 0
     
-    debug_print(f"Selected: {selected.filepath}:{selected.line}")
+    debug_print("Selected: %s:%d", selected.filepath, selected.line)
     
     # Open in vim
     print()
     print_colored(f"Opening: {selected.filepath} at line {selected.line}", Colors.GREEN)
     
+    # Does not return on success: vim replaces this process
     try:
         opener = VimOpener()
         opener.open(selected)
@@ -472,7 +724,6 @@ def main() -> int:
         print_colored(f"Error: {e}", Colors.RED)
         return 1
     
-    debug_print("Done!")
     return 0
 
 if __name__ == "__main__":